@@ -1,10 +1,12 @@
 import datetime as dt
+import functools
 import json
-import re
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import ClassVar
-from unittest.mock import create_autospec
+from types import MappingProxyType
+from typing import ClassVar, NamedTuple
+from unittest.mock import NonCallableMock, create_autospec
 
 import pytest
 from databricks.labs.lsql.core import Row
@@ -20,29 +22,52 @@ from databricks.labs.ucx.progress.history import (
 from databricks.labs.ucx.progress.install import Historical
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class _TestRecord:
     a_field: str
     b_field: int
     failures: list[str]
 
-    __id_attributes__: ClassVar[tuple[str]] = ("a_field",)
+    __id_attributes__: ClassVar[tuple[str, ...]] = ("a_field",)
 
 
-@pytest.fixture
-def ownership() -> Ownership:
-    mock_ownership = create_autospec(Ownership)
+def _reset_ownership(mock_ownership: NonCallableMock) -> Ownership:
+    """Reset the shared ownership mock in-place: default owner and no recorded calls."""
+    mock_ownership.reset_mock(return_value=True, side_effect=True)
     mock_ownership.owner_of.return_value = "mickey"
     return mock_ownership
 
 
-def test_historical_encoder_basic(ownership) -> None:
-    """Verify basic encoding of a test record into a historical record."""
-    encoder = HistoricalEncoder(job_run_id=1, workspace_id=2, ownership=ownership, klass=_TestRecord)
+@pytest.fixture(scope="module")
+def _ownership_template() -> Ownership:
+    mock_ownership = create_autospec(Ownership, instance=True)
+    mock_ownership.owner_of.return_value = "mickey"
+    return mock_ownership
+
+
+@pytest.fixture
+def ownership(_ownership_template) -> Ownership:
+    return _reset_ownership(_ownership_template)
+
+
+@pytest.fixture(scope="module")
+def _record_encoder_template(_ownership_template) -> HistoricalEncoder[_TestRecord]:
+    return HistoricalEncoder(job_run_id=1, workspace_id=2, ownership=_ownership_template, klass=_TestRecord)
 
-    assert ownership.owner_of(_TestRecord(a_field="fu", b_field=2, failures=["doh", "ray"])) == "mickey"
 
-    record = encoder.to_historical(_TestRecord(a_field="fu", b_field=2, failures=["doh", "ray"]))
+@pytest.fixture
+def record_encoder(_ownership_template, _record_encoder_template) -> HistoricalEncoder[_TestRecord]:
+    """A shared encoder for _TestRecord (job_run_id=1, workspace_id=2).
+
+    The encoder is built once per module from the shared ownership mock, which is reset here before each test.
+    """
+    _reset_ownership(_ownership_template)
+    return _record_encoder_template
+
+
+def test_historical_encoder_basic(record_encoder) -> None:
+    """Verify basic encoding of a test record into a historical record."""
+    record = record_encoder.to_historical(_TestRecord(a_field="fu", b_field=2, failures=["doh", "ray"]))
 
     expected_record = Historical(
         workspace_id=2,
@@ -61,76 +86,48 @@ def test_historical_encoder_basic(ownership) -> None:
     assert record == expected_record
 
 
-def test_historical_encoder_workspace_id(ownership) -> None:
-    """Verify the encoder produces records using the supplied workspace identifier."""
-    encoder = HistoricalEncoder(job_run_id=1, workspace_id=52, ownership=ownership, klass=_TestRecord)
-
-    record = _TestRecord(a_field="whatever", b_field=2, failures=[])
-    historical = encoder.to_historical(record)
-    assert historical.workspace_id == 52
-
-
-def test_historical_encoder_run_id(ownership) -> None:
-    """Verify the encoder produces records using the supplied job-run identifier."""
-    encoder = HistoricalEncoder(job_run_id=42, workspace_id=2, ownership=ownership, klass=_TestRecord)
-
-    record = _TestRecord(a_field="whatever", b_field=2, failures=[])
-    historical = encoder.to_historical(record)
-    assert historical.job_run_id == 42
+def test_historical_encoder_scalar_fields(ownership) -> None:
+    """Verify the encoder uses the supplied identifiers, the current UCX version and the record type name."""
+    encoder = HistoricalEncoder(job_run_id=42, workspace_id=52, ownership=ownership, klass=_TestRecord)
 
+    historical = encoder.to_historical(_TestRecord(a_field="whatever", b_field=2, failures=[]))
 
-def test_historical_encoder_ucx_version(ownership) -> None:
-    """Verify the encoder produces records containing the current UCX version."""
-    encoder = HistoricalEncoder(job_run_id=1, workspace_id=2, ownership=ownership, klass=_TestRecord)
+    scalar_fields = (historical.workspace_id, historical.job_run_id, historical.ucx_version, historical.object_type)
+    assert scalar_fields == (52, 42, ucx_version, "_TestRecord")
 
-    record = _TestRecord(a_field="whatever", b_field=2, failures=[])
-    historical = encoder.to_historical(record)
-    assert historical.ucx_version == ucx_version
 
-
-def test_historical_encoder_ownership(ownership) -> None:
+def test_historical_encoder_ownership(ownership, record_encoder) -> None:
     """Verify the encoder produces records with the owner determined by the supplied ownership instance."""
     expected_owners = ("bob", "jane", "tarzan")
     ownership.owner_of.side_effect = expected_owners
 
-    records = [_TestRecord(a_field="whatever", b_field=x, failures=[]) for x in range(len(expected_owners))]
-    encoder = HistoricalEncoder(job_run_id=1, workspace_id=2, ownership=ownership, klass=_TestRecord)
-
-    encoded_records = [encoder.to_historical(record) for record in records]
-    owners = tuple(encoded_record.owner for encoded_record in encoded_records)
+    owners = tuple(
+        record_encoder.to_historical(_TestRecord(a_field="whatever", b_field=x, failures=[])).owner
+        for x in range(len(expected_owners))
+    )
 
     assert owners == expected_owners
     assert ownership.owner_of.call_count == 3
 
 
-def test_historical_encoder_object_type(ownership) -> None:
-    """Verify the encoder uses the name of the record type as the object type for records."""
-    encoder = HistoricalEncoder(job_run_id=1, workspace_id=2, ownership=ownership, klass=_TestRecord)
+@dataclass
+class _CompoundKey:
+    a_field: str = "field-a"
+    b_field: str = "field-b"
+    c_field: "str" = "field-c"  # Annotations can be strings as well.
 
-    record = _TestRecord(a_field="whatever", b_field=2, failures=[])
-    historical = encoder.to_historical(record)
-    assert historical.object_type == "_TestRecord"
+    @property
+    def d_property(self) -> str:
+        return "property-d"
 
+    __id_attributes__: ClassVar = ("a_field", "c_field", "b_field", "d_property")
 
-def test_historical_encoder_object_id(ownership) -> None:
-    """Verify the encoder uses the configured object-id fields from the record type in the encoded records."""
-    encoder1 = HistoricalEncoder(job_run_id=1, workspace_id=2, ownership=ownership, klass=_TestRecord)
 
-    historical1 = encoder1.to_historical(_TestRecord(a_field="used_for_key", b_field=2, failures=[]))
+def test_historical_encoder_object_id(ownership, record_encoder) -> None:
+    """Verify the encoder uses the configured object-id fields from the record type in the encoded records."""
+    historical1 = record_encoder.to_historical(_TestRecord(a_field="used_for_key", b_field=2, failures=[]))
     assert historical1.object_id == ["used_for_key"]
 
-    @dataclass
-    class _CompoundKey:
-        a_field: str = "field-a"
-        b_field: str = "field-b"
-        c_field: "str" = "field-c"  # Annotations can be strings as well.
-
-        @property
-        def d_property(self) -> str:
-            return "property-d"
-
-        __id_attributes__: ClassVar = ("a_field", "c_field", "b_field", "d_property")
-
     encoder2 = HistoricalEncoder(job_run_id=1, workspace_id=2, ownership=ownership, klass=_CompoundKey)
     historical2 = encoder2.to_historical(_CompoundKey())
 
@@ -138,13 +135,13 @@ def test_historical_encoder_object_id(ownership) -> None:
     assert historical2.object_id == ["field-a", "field-c", "field-b", "property-d"]
 
 
-def test_historical_encoder_object_id_verification_no_id(ownership) -> None:
-    """Check that during initialization we fail if there is no __id_attributes__ defined."""
+@dataclass
+class _NoId:
+    pass
 
-    @dataclass
-    class _NoId:
-        pass
 
+def test_historical_encoder_object_id_verification_no_id(ownership) -> None:
+    """Check that during initialization we fail if there is no __id_attributes__ defined."""
     with pytest.raises(AttributeError) as excinfo:
         HistoricalEncoder(job_run_id=1, workspace_id=1, ownership=ownership, klass=_NoId)
 
@@ -174,56 +171,56 @@ class _WrongTypeIdProperty:
 @pytest.mark.parametrize("wrong_id_type_class", (_WrongTypeIdFields, _WrongTypeIdProperty))
 def test_historical_encoder_object_id_verification_wrong_type(ownership, wrong_id_type_class: type[Record]) -> None:
     """Check that during initialization we fail if the id attributes are declared but are not strings."""
-
     expected_msg = r"^Historical record <class '.*'> has a non-string id attribute: not_ok \(type=<class 'int'>\)$"
     with pytest.raises(TypeError, match=expected_msg):
         HistoricalEncoder(job_run_id=1, workspace_id=1, ownership=ownership, klass=wrong_id_type_class)
 
 
-def test_historical_encoder_object_id_verification_no_property_type(ownership) -> None:
-    """Check that during initialization we fail if the id attributes are declared but are not strings."""
+@dataclass
+class _NoTypeIdProperty:
+    ok: str
 
-    @dataclass
-    class _NoTypeIdProperty:
-        ok: str
+    @property
+    def not_ok(self):
+        return 0
 
-        @property
-        def not_ok(self):
-            return 0
+    __id_attributes__: ClassVar = ["ok", "not_ok"]
 
-        __id_attributes__: ClassVar = ["ok", "not_ok"]
 
+def test_historical_encoder_object_id_verification_no_property_type(ownership) -> None:
+    """Check that during initialization we fail if the id attributes are declared but are not strings."""
     expected_msg = "^Historical record <class '.*'> has a property with no type as an id attribute: not_ok$"
     with pytest.raises(TypeError, match=expected_msg):
         HistoricalEncoder(job_run_id=1, workspace_id=1, ownership=ownership, klass=_NoTypeIdProperty)
 
 
-def test_historical_encoder_object_id_verification_non_readable_property(ownership) -> None:
-    """Check that during initialization we fail if an id attribute refers to a non-readable property."""
+@dataclass
+class _NonReadableIdProperty:
+    ok: str
+
+    __id_attributes__: ClassVar = ["ok", "not_ok"]
 
-    @dataclass
-    class _NonReadableIdProperty:
-        ok: str
 
-        __id_attributes__: ClassVar = ["ok", "not_ok"]
+# Has to be injected after class declaration to avoid being treated as a field.
+_NonReadableIdProperty.not_ok = property(doc="A non-readable-property")  # type: ignore[attr-defined]
 
-    # Has to be injected after class declaration to avoid being treated as a field.
-    _NonReadableIdProperty.not_ok = property(doc="A non-readable-property")  # type: ignore[attr-defined]
 
+def test_historical_encoder_object_id_verification_non_readable_property(ownership) -> None:
+    """Check that during initialization we fail if an id attribute refers to a non-readable property."""
     expected_msg = r"^Historical record <class '.*'> has a non-readable property as an id attribute: not_ok$"
     with pytest.raises(TypeError, match=expected_msg):
         HistoricalEncoder(job_run_id=1, workspace_id=1, ownership=ownership, klass=_NonReadableIdProperty)
 
 
-def test_historical_encoder_object_id_verification_missing_attribute(ownership) -> None:
-    """Check that during initialization we fail if an id attribute refers to an attribute that does not exist."""
+@dataclass
+class _MissingAttribute:
+    ok: str
 
-    @dataclass
-    class _MissingAttribute:
-        ok: str
+    __id_attributes__: ClassVar = ["ok", "not_ok"]
 
-        __id_attributes__: ClassVar = ["ok", "not_ok"]
 
+def test_historical_encoder_object_id_verification_missing_attribute(ownership) -> None:
+    """Check that during initialization we fail if an id attribute refers to an attribute that does not exist."""
     with pytest.raises(AttributeError) as excinfo:
         HistoricalEncoder(job_run_id=1, workspace_id=1, ownership=ownership, klass=_MissingAttribute)
 
@@ -231,119 +228,121 @@ def test_historical_encoder_object_id_verification_missing_attribute(ownership)
     assert excinfo.value.name == "not_ok"
 
 
-def test_historical_encoder_object_id_verification_not_field_or_property(ownership) -> None:
-    """Check that during initialization we fail if an id attribute refers an attribute that isn't a field or property."""
+@dataclass
+class _NotFieldOrProperty:
+    ok: str
 
-    @dataclass
-    class _NotFieldOrProperty:
-        ok: str
+    def not_ok(self) -> str:
+        return ""
 
-        def not_ok(self) -> str:
-            return ""
+    __id_attributes__: ClassVar = ["ok", "not_ok"]
 
-        __id_attributes__: ClassVar = ["ok", "not_ok"]
 
+def test_historical_encoder_object_id_verification_not_field_or_property(ownership) -> None:
+    """Check that during initialization we fail if an id attribute refers an attribute that isn't a field or property."""
     expected_msg = r"^Historical record <class '.*'> declares an id attribute that is not a field or property: not_ok \(type=<.*>\)$"
     with pytest.raises(TypeError, match=expected_msg):
         HistoricalEncoder(job_run_id=1, workspace_id=1, ownership=ownership, klass=_NotFieldOrProperty)
 
 
-def test_historical_encoder_object_data(ownership) -> None:
-    """Verify the encoder includes all dataclass fields in the object data."""
-    encoder1 = HistoricalEncoder(job_run_id=1, workspace_id=2, ownership=ownership, klass=_TestRecord)
+@dataclass
+class _AnotherClass:
+    field_1: str = "foo"
+    field_2: str = "bar"
+    field_3: str = "baz"
+    field_4: str = "daz"
 
-    historical1 = encoder1.to_historical(_TestRecord(a_field="used_for_key", b_field=2, failures=[]))
-    assert set(historical1.data.keys()) == {"a_field", "b_field"}
+    __id_attributes__: ClassVar = ("field_1",)
 
-    @dataclass
-    class _AnotherClass:
-        field_1: str = "foo"
-        field_2: str = "bar"
-        field_3: str = "baz"
-        field_4: str = "daz"
 
-        __id_attributes__: ClassVar = ("field_1",)
+def test_historical_encoder_object_data(ownership, record_encoder) -> None:
+    """Verify the encoder includes all dataclass fields in the object data."""
+    historical1 = record_encoder.to_historical(_TestRecord(a_field="used_for_key", b_field=2, failures=[]))
+    assert set(historical1.data.keys()) == {"a_field", "b_field"}
 
     encoder2 = HistoricalEncoder(job_run_id=1, workspace_id=2, ownership=ownership, klass=_AnotherClass)
     historical2 = encoder2.to_historical(_AnotherClass())
     assert set(historical2.data.keys()) == {"field_1", "field_2", "field_3", "field_4"}
 
 
-def test_historical_encoder_object_data_values_strings_as_is(ownership) -> None:
-    """Verify that string fields are encoded as-is in the object_data"""
+@dataclass
+class _AClassStrings:
+    a_field: str = "value"
+    existing_json_field: "str" = "[1, 2, 3]"
+    optional_string_field: str | None = "value"
 
-    @dataclass
-    class _AClass:
-        a_field: str = "value"
-        existing_json_field: "str" = "[1, 2, 3]"
-        optional_string_field: str | None = "value"
+    __id_attributes__: ClassVar = ("a_field",)
 
-        __id_attributes__: ClassVar = ("a_field",)
 
-    encoder = HistoricalEncoder(job_run_id=1, workspace_id=2, ownership=ownership, klass=_AClass)
-    historical = encoder.to_historical(_AClass())
+def test_historical_encoder_object_data_values_strings_as_is(ownership) -> None:
+    """Verify that string fields are encoded as-is in the object_data"""
+    encoder = HistoricalEncoder(job_run_id=1, workspace_id=2, ownership=ownership, klass=_AClassStrings)
+    historical = encoder.to_historical(_AClassStrings())
     assert historical.data == {"a_field": "value", "existing_json_field": "[1, 2, 3]", "optional_string_field": "value"}
 
 
-def test_historical_encoder_object_data_missing_optional_values(ownership) -> None:
-    """Verify the encoding of missing (optional) field values."""
+@dataclass(frozen=True, slots=True)
+class _InnerClassOptional:
+    optional_field: str | None = None
 
-    @dataclass(frozen=True)
-    class _InnerClass:
-        optional_field: str | None = None
 
-    @dataclass
-    class _AClass:
-        a_field: str = "value"
-        optional_field: str | None = None
-        nested: _InnerClass = _InnerClass()
+@dataclass
+class _AClassOptional:
+    a_field: str = "value"
+    optional_field: str | None = None
+    nested: _InnerClassOptional = _InnerClassOptional()
+
+    __id_attributes__: ClassVar = ("a_field",)
 
-        __id_attributes__: ClassVar = ("a_field",)
 
-    encoder = HistoricalEncoder(job_run_id=1, workspace_id=2, ownership=ownership, klass=_AClass)
-    historical = encoder.to_historical(_AClass())
+def test_historical_encoder_object_data_missing_optional_values(ownership) -> None:
+    """Verify the encoding of missing (optional) field values."""
+    encoder = HistoricalEncoder(job_run_id=1, workspace_id=2, ownership=ownership, klass=_AClassOptional)
+    historical = encoder.to_historical(_AClassOptional())
     assert "optional_field" not in historical.data, "First-level optional fields should be elided if None"
     assert historical.data["nested"] == '{"optional_field":null}', "Nested optional fields should be encoded as nulls"
 
 
-def test_historical_encoder_object_data_values_non_strings_as_json(ownership) -> None:
-    """Verify that non-string fields are encoded as JSON in the object_data"""
+@dataclass(frozen=True, slots=True)
+class _InnerClassMixed:
+    counter: int
+    boolean: bool = True
+    a_field: str = "bar"
+    optional: str | None = None
+
+
+class _Suit(Enum):
+    HEARTS = 1
+    DIAMONDS = 2
+    CLUBS = 3
+    SPADES = 4
 
-    @dataclass(frozen=True)
-    class _InnerClass:
-        counter: int
-        boolean: bool = True
-        a_field: str = "bar"
-        optional: str | None = None
-
-    class _Suit(Enum):
-        HEARTS = 1
-        DIAMONDS = 2
-        CLUBS = 3
-        SPADES = 4
-
-    @dataclass
-    class _AClass:
-        str_field: str = "foo"
-        int_field: int = 23
-        bool_field: bool = True
-        float_field: float = 2.3
-        enum_field: _Suit = _Suit.HEARTS
-        date_field: dt.date = field(default_factory=lambda: dt.date(year=2024, month=10, day=15))
-        ts_field: dt.datetime = field(
-            default_factory=lambda: dt.datetime(
-                year=2024, month=10, day=15, hour=12, minute=44, second=16, tzinfo=dt.timezone.utc
-            )
+
+@dataclass
+class _AClassMixed:
+    str_field: str = "foo"
+    int_field: int = 23
+    bool_field: bool = True
+    float_field: float = 2.3
+    enum_field: _Suit = _Suit.HEARTS
+    date_field: dt.date = field(default_factory=lambda: dt.date(year=2024, month=10, day=15))
+    ts_field: dt.datetime = field(
+        default_factory=lambda: dt.datetime(
+            year=2024, month=10, day=15, hour=12, minute=44, second=16, tzinfo=dt.timezone.utc
         )
-        array_field: list[str] = field(default_factory=lambda: ["foo", "bar", "baz"])
-        set_field: set[str] = field(default_factory=lambda: {"fu", "baa", "boz"})
-        dict_field: dict[int, str] = field(default_factory=lambda: {1000: "M", 100: "C"})
-        nested_dataclass: list[_InnerClass] = field(default_factory=lambda: [_InnerClass(x) for x in range(2)])
+    )
+    array_field: list[str] = field(default_factory=lambda: ["foo", "bar", "baz"])
+    set_field: set[str] = field(default_factory=lambda: {"fu", "baa", "boz"})
+    dict_field: dict[int, str] = field(default_factory=lambda: {1000: "M", 100: "C"})
+    nested_dataclass: list[_InnerClassMixed] = field(default_factory=lambda: [_InnerClassMixed(x) for x in range(2)])
 
-        __id_attributes__: ClassVar = ("str_field",)
+    __id_attributes__: ClassVar = ("str_field",)
 
-    encoder = HistoricalEncoder(job_run_id=1, workspace_id=2, ownership=ownership, klass=_AClass)
-    historical = encoder.to_historical(_AClass())
+
+def test_historical_encoder_object_data_values_non_strings_as_json(ownership) -> None:
+    """Verify that non-string fields are encoded as JSON in the object_data"""
+    encoder = HistoricalEncoder(job_run_id=1, workspace_id=2, ownership=ownership, klass=_AClassMixed)
+    historical = encoder.to_historical(_AClassMixed())
     # Python set iteration doesn't preserve order, so we need to check set_field separately.
     set_field = historical.data.pop("set_field")
     assert historical.data == {
@@ -363,28 +362,28 @@ def test_historical_encoder_object_data_values_non_strings_as_json(ownership) ->
     assert set(decoded_set_field) == {"fu", "baa", "boz"}
 
 
-def test_historical_encoder_object_data_imposter_string_values(ownership) -> None:
-    """Verify that string fields containing non-string values are handled as an error."""
+@dataclass
+class _AClassImposter:
+    a_field: str = "value"
+    the_string_field: str | None = None
 
-    @dataclass
-    class _AClass:
-        a_field: str = "value"
-        the_string_field: str | None = None
+    __id_attributes__: ClassVar = ("a_field",)
 
-        __id_attributes__: ClassVar = ("a_field",)
 
-    encoder = HistoricalEncoder(job_run_id=1, workspace_id=2, ownership=ownership, klass=_AClass)
-    record_with_imposter = _AClass(the_string_field=2)  # type: ignore[arg-type]
+def test_historical_encoder_object_data_imposter_string_values(ownership) -> None:
+    """Verify that string fields containing non-string values are handled as an error."""
+    encoder = HistoricalEncoder(job_run_id=1, workspace_id=2, ownership=ownership, klass=_AClassImposter)
+    record_with_imposter = _AClassImposter(the_string_field=2)  # type: ignore[arg-type]
     with pytest.raises(ValueError, match=r"^Invalid value for field the_string_field, not a string: 2$"):
         _ = encoder.to_historical(record_with_imposter)
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class _InnerClassWithTimestamp:
     b_field: dt.datetime
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class _OuterclassWithTimestamps:
     object_id: str = "not used"
     a_field: dt.datetime | None = None
@@ -393,28 +392,33 @@ class _OuterclassWithTimestamps:
     __id_attributes__: ClassVar = ("object_id",)
 
 
+_NAIVE_TIMESTAMP = dt.datetime(2024, 1, 1)
+
+
 @pytest.mark.parametrize(
     "field_name,record",
     (
-        ("a_field", _OuterclassWithTimestamps(a_field=dt.datetime.now())),
-        ("inner", _OuterclassWithTimestamps(inner=_InnerClassWithTimestamp(b_field=dt.datetime.now()))),
+        ("a_field", _OuterclassWithTimestamps(a_field=_NAIVE_TIMESTAMP)),
+        ("inner", _OuterclassWithTimestamps(inner=_InnerClassWithTimestamp(b_field=_NAIVE_TIMESTAMP))),
     ),
 )
 def test_historical_encoder_naive_timestamps_banned(ownership, field_name, record: _OuterclassWithTimestamps) -> None:
     """Verify that encoding detects and disallows naive timestamps."""
     encoder = HistoricalEncoder(job_run_id=1, workspace_id=2, ownership=ownership, klass=_OuterclassWithTimestamps)
 
-    expected_msg = f"Timestamp without timezone not supported in or within field {field_name}"
-    with pytest.raises(ValueError, match=f"^{re.escape(expected_msg)}"):
+    with pytest.raises(ValueError) as excinfo:
         _ = encoder.to_historical(record)
 
+    expected_msg = f"Timestamp without timezone not supported in or within field {field_name}: {_NAIVE_TIMESTAMP}"
+    assert str(excinfo.value) == expected_msg
+
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class _InnerClassWithUnserializable:
     b_field: object
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class _OuterclassWithUnserializable:
     object_id: str = "not used"
     a_field: object | None = None
@@ -423,44 +427,50 @@ class _OuterclassWithUnserializable:
     __id_attributes__: ClassVar = ("object_id",)
 
 
+_UNSERIALIZABLE_VALUE = object()
+
+
 @pytest.mark.parametrize(
     "field_name,record",
     (
-        ("a_field", _OuterclassWithUnserializable(a_field=object())),
-        ("inner", _OuterclassWithUnserializable(inner=_InnerClassWithUnserializable(b_field=object()))),
+        ("a_field", _OuterclassWithUnserializable(a_field=_UNSERIALIZABLE_VALUE)),
+        ("inner", _OuterclassWithUnserializable(inner=_InnerClassWithUnserializable(b_field=_UNSERIALIZABLE_VALUE))),
     ),
 )
 def test_historical_encoder_unserializable_values(ownership, field_name, record: _OuterclassWithUnserializable) -> None:
     """Verify that encoding catches and handles unserializable values."""
     encoder = HistoricalEncoder(job_run_id=1, workspace_id=2, ownership=ownership, klass=_OuterclassWithUnserializable)
 
-    expected_msg = f"^Cannot encode .* value in or within field {re.escape(field_name)}: "
-    with pytest.raises(TypeError, match=expected_msg):
+    with pytest.raises(TypeError) as excinfo:
         _ = encoder.to_historical(record)
 
+    # The value itself is a (deep) copy of the original, so only the message prefix can be checked.
+    assert str(excinfo.value).startswith(
+        f"Cannot encode {type(_UNSERIALIZABLE_VALUE)} value in or within field {field_name}: "
+    )
+
 
-@pytest.mark.parametrize("failures", (["failures-1", "failures-2"], []))
-def test_historical_encoder_failures_list(ownership, failures: list[str]) -> None:
+def test_historical_encoder_failures_list(record_encoder) -> None:
     """Verify an encoder places a failures list on the top-level field instead of within the object data."""
-    encoder = HistoricalEncoder(job_run_id=1, workspace_id=2, ownership=ownership, klass=_TestRecord)
+    failures_lists: tuple[list[str], ...] = (["failures-1", "failures-2"], [])
+    for failures in failures_lists:
+        historical = record_encoder.to_historical(_TestRecord(a_field="foo", b_field=10, failures=list(failures)))
 
-    historical = encoder.to_historical(_TestRecord(a_field="foo", b_field=10, failures=list(failures)))
+        assert historical.failures == failures
+        assert "failures" not in historical.data
 
-    assert historical.failures == failures
-    assert "failures" not in historical.data
+
+@dataclass
+class _FailuresEncodedJson:
+    failures: str
+    an_id: str = "the_id"
+
+    __id_attributes__: ClassVar = ("an_id",)
 
 
 @pytest.mark.parametrize("failures", ('["failures-1", "failures-2"]', '[]', ''))
 def test_historical_encoder_json_encoded_failures_list(ownership, failures: str) -> None:
     """Verify an encoder places a pre-encoded JSON list of failures on the top-level field instead of within the object data."""
-
-    @dataclass
-    class _FailuresEncodedJson:
-        failures: str
-        an_id: str = "the_id"
-
-        __id_attributes__: ClassVar = ("an_id",)
-
     encoder = HistoricalEncoder(job_run_id=1, workspace_id=2, ownership=ownership, klass=_FailuresEncodedJson)
 
     historical = encoder.to_historical(_FailuresEncodedJson(failures=failures))
@@ -493,53 +503,72 @@ def test_historical_encoder_failures_verification(
     broken_type: type,
 ) -> None:
     """Verify that encoders checks the failures field type during initialization."""
-
-    expected_msg = f"^Historical record {re.escape(str(klass))} has invalid 'failures' attribute of type: {re.escape(str(broken_type))}$"
-    with pytest.raises(TypeError, match=expected_msg):
+    with pytest.raises(TypeError) as excinfo:
         _ = HistoricalEncoder(job_run_id=1, workspace_id=2, ownership=ownership, klass=klass)
 
+    assert str(excinfo.value) == f"Historical record {klass} has invalid 'failures' attribute of type: {broken_type}"
+
+
+_expected_row = functools.partial(Row, workspace_id=2, job_run_id=1, object_type="_TestRecord", ucx_version=ucx_version)
+
+
+class _HistoryLogRecord(NamedTuple):
+    """A record journalled by the history-log tests, along with the object data expected for it."""
+
+    a_field: str
+    b_field: int
+    failures: tuple[str, ...]
+    expected_data: Mapping[str, str]
+
+
+_HISTORY_LOG_RECORDS: tuple[_HistoryLogRecord, ...] = (
+    _HistoryLogRecord(
+        a_field="first_record",
+        b_field=1,
+        failures=(),
+        expected_data=MappingProxyType({"a_field": "first_record", "b_field": "1"}),
+    ),
+    _HistoryLogRecord(
+        a_field="second_record",
+        b_field=2,
+        failures=("a_failure",),
+        expected_data=MappingProxyType({"a_field": "second_record", "b_field": "2"}),
+    ),
+    _HistoryLogRecord(
+        a_field="third_record",
+        b_field=3,
+        failures=("another_failure", "yet_another_failure"),
+        expected_data=MappingProxyType({"a_field": "third_record", "b_field": "3"}),
+    ),
+)
+
 
-def test_history_log_appends_historical_records(mock_backend, ownership) -> None:
+@pytest.fixture(scope="module")
+def history_log_records() -> tuple[_TestRecord, ...]:
+    """The records journalled by the history-log tests.
+
+    These instances (including their failures lists) are shared by every test in this module: tests must not mutate
+    them.
+    """
+    return tuple(
+        _TestRecord(a_field=record.a_field, b_field=record.b_field, failures=list(record.failures))
+        for record in _HISTORY_LOG_RECORDS
+    )
+
+
+def test_history_log_appends_historical_records(mock_backend, ownership, history_log_records) -> None:
     """Verify that we can journal a snapshot of records to the historical log."""
     ownership.owner_of.side_effect = lambda o: f"owner-{o.a_field}"
 
-    records = (
-        _TestRecord(a_field="first_record", b_field=1, failures=[]),
-        _TestRecord(a_field="second_record", b_field=2, failures=["a_failure"]),
-        _TestRecord(a_field="third_record", b_field=3, failures=["another_failure", "yet_another_failure"]),
-    )
-    expected_historical_entries = (
-        Row(
-            workspace_id=2,
-            job_run_id=1,
-            object_type="_TestRecord",
-            object_id=["first_record"],
-            data={"a_field": "first_record", "b_field": "1"},
-            failures=[],
-            owner="owner-first_record",
-            ucx_version=ucx_version,
-        ),
-        Row(
-            workspace_id=2,
-            job_run_id=1,
-            object_type="_TestRecord",
-            object_id=["second_record"],
-            data={"a_field": "second_record", "b_field": "2"},
-            failures=["a_failure"],
-            owner="owner-second_record",
-            ucx_version=ucx_version,
-        ),
-        Row(
-            workspace_id=2,
-            job_run_id=1,
-            object_type="_TestRecord",
-            object_id=["third_record"],
-            data={"a_field": "third_record", "b_field": "3"},
-            failures=["another_failure", "yet_another_failure"],
-            owner="owner-third_record",
-            ucx_version=ucx_version,
-        ),
-    )
+    expected_historical_entries = []
+    for record in _HISTORY_LOG_RECORDS:
+        expected_row = _expected_row(
+            object_id=[record.a_field],
+            data=record.expected_data,
+            failures=list(record.failures),
+            owner=f"owner-{record.a_field}",
+        )
+        expected_historical_entries.append(expected_row)
 
     history_log = ProgressEncoder(
         mock_backend,
@@ -551,18 +580,16 @@ def test_history_log_appends_historical_records(mock_backend, ownership) -> None
         schema="the_schema",
         table="the_table",
     )
-    history_log.append_inventory_snapshot(records)
+    history_log.append_inventory_snapshot(history_log_records)
 
     rows_appended = mock_backend.rows_written_for("`the_catalog`.`the_schema`.`the_table`", mode="append")
-    assert rows_appended == list(expected_historical_entries)
+    assert rows_appended == expected_historical_entries
 
 
-def test_history_log_default_location(mock_backend, ownership) -> None:
+def test_history_log_default_location(mock_backend, ownership, history_log_records) -> None:
     """Verify that the history log defaults to the ucx.history in the configured catalog."""
-
-    record = _TestRecord(a_field="foo", b_field=1, failures=[])
     history_log = ProgressEncoder(mock_backend, ownership, _TestRecord, run_id=1, workspace_id=2, catalog="the_catalog")
-    history_log.append_inventory_snapshot([record])
+    history_log.append_inventory_snapshot(history_log_records)
 
     assert history_log.full_name == "the_catalog.multiworkspace.historical"
     assert mock_backend.has_rows_written_for("`the_catalog`.`multiworkspace`.`historical`")